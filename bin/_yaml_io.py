@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""
+Shared YAML IO for the Darwin bin scripts.
+Uses the libyaml C parser/emitter when PyYAML was built with it, and
+memoizes parsed files on (path, mtime) so repeated loads are dict lookups.
+"""
+
+import functools
+import yaml
+from pathlib import Path
+
+Loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+Dumper = getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
+
+
+@functools.lru_cache(maxsize=None)
+def _load_yaml_cached(path_str: str, mtime_ns: int) -> dict:
+    """Parse a YAML file, memoized on (path, mtime)."""
+    with open(path_str, 'r') as f:
+        return yaml.load(f, Loader=Loader) or {}
+
+
+def load_yaml(path: Path) -> dict:
+    """Load YAML file."""
+    if not path.exists():
+        return {}
+    return _load_yaml_cached(str(path), path.stat().st_mtime_ns)
+
+
+def save_yaml(path: Path, data: dict):
+    """Save YAML file."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'w') as f:
+        yaml.dump(data, f, Dumper=Dumper, default_flow_style=False, sort_keys=False)
+    _load_yaml_cached.cache_clear()
+
+
+def append_yaml(path: Path, data):
+    """Append a YAML fragment to an append-only log file."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'a') as f:
+        yaml.dump(data, f, Dumper=Dumper, default_flow_style=False, sort_keys=False)
@@ -5,47 +5,46 @@ Compiles skill definitions (YAML) into executable skills (Markdown)
 Usage: python compile.py [skill_name] or python compile.py --all
 """
 
+import io
 import os
 import sys
-import yaml
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
 from datetime import datetime
+from functools import partial
 from pathlib import Path
 
+from _yaml_io import load_yaml, save_yaml
+
 DARWIN_DIR = Path.home() / ".claude" / "darwin"
 MODULES_FILE = DARWIN_DIR / "modules" / "registry.yaml"
 SKILLS_DIR = DARWIN_DIR / "skills"
 OUTPUT_DIR = Path.home() / ".claude" / "commands"
 
 
-def load_yaml(path):
-    """Load YAML file."""
-    with open(path, 'r') as f:
-        return yaml.safe_load(f)
-
+def flatten_registry(registry):
+    """Flatten the registry into a {(module_type, version): prompt} dict."""
+    return {
+        (module_type, version): variant.get('prompt', '')
+        for module_type, module in registry.get('modules', {}).items()
+        for version, variant in module.items()
+    }
 
-def save_yaml(path, data):
-    """Save YAML file."""
-    with open(path, 'w') as f:
-        yaml.dump(data, f, default_flow_style=False, sort_keys=False)
 
+def compile_skill(skill_name, prompts, skill_file=None, timestamp=None):
+    """Compile a single skill from its definition.
 
-def get_module_prompt(registry, module_type, version):
-    """Get module prompt by type and version."""
-    modules = registry.get('modules', {})
-    module = modules.get(module_type, {})
-    variant = module.get(version, {})
-    return variant.get('prompt', '')
+    Callers that already hold the definition's Path (e.g. from a directory
+    listing) can pass it as skill_file to skip the existence check.
+    """
+    if skill_file is None:
+        skill_file = SKILLS_DIR / f"{skill_name}.yaml"
+        if not skill_file.exists():
+            print(f"Error: Skill definition not found: {skill_file}")
+            return False
 
-
-def compile_skill(skill_name, registry):
-    """Compile a single skill from its definition."""
-    skill_file = SKILLS_DIR / f"{skill_name}.yaml"
     output_file = OUTPUT_DIR / f"{skill_name}.md"
 
-    if not skill_file.exists():
-        print(f"Error: Skill definition not found: {skill_file}")
-        return False
-
     print(f"Compiling: {skill_name}")
 
     # Load skill definition
@@ -65,47 +64,38 @@ def compile_skill(skill_name, registry):
     validation_ver = modules.get('validation', 'v3')
 
     # Get module prompts
-    input_prompt = get_module_prompt(registry, 'input', input_ver)
-    research_prompt = get_module_prompt(registry, 'research', research_ver)
-    output_prompt = get_module_prompt(registry, 'output', output_ver)
-    workflow_prompt = get_module_prompt(registry, 'workflow', workflow_ver)
-    validation_prompt = get_module_prompt(registry, 'validation', validation_ver)
+    input_prompt = prompts.get(('input', input_ver), '')
+    research_prompt = prompts.get(('research', research_ver), '')
+    output_prompt = prompts.get(('output', output_ver), '')
+    workflow_prompt = prompts.get(('workflow', workflow_ver), '')
+    validation_prompt = prompts.get(('validation', validation_ver), '')
 
     # Get core prompt
     core_prompt = skill.get('core_prompt', '')
 
-    # Assemble the skill
-    assembled = f"""---
-description: {description}
-darwin_version: {version}
-darwin_modules:
-  input: {input_ver}
-  research: {research_ver}
-  structure: {structure_ver}
-  output: {output_ver}
-  workflow: {workflow_ver}
-  validation: {validation_ver}
----
-
-{core_prompt}
-
-{input_prompt}
-
-{research_prompt}
-
-{output_prompt}
-
-{workflow_prompt}
-
-{validation_prompt}
-"""
-
-    # Write output
-    with open(output_file, 'w') as f:
-        f.write(assembled)
+    # Assemble the skill from parts to avoid large intermediate strings
+    parts = [
+        "---\n",
+        f"description: {description}\n",
+        f"darwin_version: {version}\n",
+        "darwin_modules:\n",
+        f"  input: {input_ver}\n",
+        f"  research: {research_ver}\n",
+        f"  structure: {structure_ver}\n",
+        f"  output: {output_ver}\n",
+        f"  workflow: {workflow_ver}\n",
+        f"  validation: {validation_ver}\n",
+        "---\n",
+    ]
+    for prompt in (core_prompt, input_prompt, research_prompt,
+                   output_prompt, workflow_prompt, validation_prompt):
+        parts.append(f"\n{prompt}\n")
+
+    # Write output in one syscall, skipping the text codec layer
+    output_file.write_bytes("".join(parts).encode("utf-8"))
 
     # Update last_compiled in skill definition
-    skill['last_compiled'] = datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ")
+    skill['last_compiled'] = timestamp or datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ")
     save_yaml(skill_file, skill)
 
     print(f"  → {output_file}")
@@ -114,14 +104,23 @@ darwin_modules:
     return True
 
 
+def _compile_worker(skill_file, prompts, timestamp):
+    """Compile one skill in a pool worker, buffering output for ordered printing."""
+    buf = io.StringIO()
+    with redirect_stdout(buf):
+        compile_skill(skill_file.stem, prompts, skill_file=skill_file, timestamp=timestamp)
+    return buf.getvalue()
+
+
 def main():
     # Check if registry exists
     if not MODULES_FILE.exists():
         print(f"Error: Module registry not found: {MODULES_FILE}")
         sys.exit(1)
 
-    # Load registry
+    # Load registry and flatten module prompts once
     registry = load_yaml(MODULES_FILE)
+    prompts = flatten_registry(registry)
 
     if len(sys.argv) < 2:
         print("Usage: compile.py [skill_name] or compile.py --all")
@@ -137,15 +136,22 @@ def main():
         print("═══════════════════════════════════════════════════")
         print("")
 
-        for skill_file in SKILLS_DIR.glob("*.yaml"):
-            compile_skill(skill_file.stem, registry)
-            print("")
+        # Compiles are CPU-bound on YAML parse/emit; fan out across cores,
+        # handing each worker the Path from the listing to avoid re-statting
+        skill_files = list(SKILLS_DIR.glob("*.yaml"))
+        # One timestamp for the whole batch; every skill shares the same
+        # last_compiled moment
+        now_iso = datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ")
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+            worker = partial(_compile_worker, prompts=prompts, timestamp=now_iso)
+            for output in executor.map(worker, skill_files):
+                print(output)
 
         print("═══════════════════════════════════════════════════")
         print("Compilation complete")
         print("═══════════════════════════════════════════════════")
     else:
-        compile_skill(sys.argv[1], registry)
+        compile_skill(sys.argv[1], prompts)
 
 
 if __name__ == "__main__":
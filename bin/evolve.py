@@ -18,21 +18,32 @@ Usage:
 """
 
 import os
+import re
 import sys
 import json
-import yaml
+import bisect
 import random
 import subprocess
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
+try:
+    import orjson  # C serializer; optional, stdlib json is the fallback
+except ImportError:
+    orjson = None
+
 DARWIN_DIR = Path.home() / ".claude" / "darwin"
 MODULES_FILE = DARWIN_DIR / "modules" / "registry.yaml"
 SKILLS_DIR = DARWIN_DIR / "skills"
 CHANGELOGS_DIR = DARWIN_DIR / "changelogs"
 EVALUATIONS_DIR = DARWIN_DIR / "evaluations"
 
+# Reuse the compiler and YAML helpers in-process
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+import compile as compile_mod
+from _yaml_io import load_yaml, save_yaml, append_yaml
+
 # Fitness thresholds
 THRESHOLDS = {
     "top_performer": 0.70,
@@ -41,58 +52,50 @@ THRESHOLDS = {
     "failing": 0.20
 }
 
+# Sorted cutoffs derived from THRESHOLDS for bisect-based classification;
+# bisect_right keeps the >= boundary semantics of the original if/elif chain
+_CUTS = [THRESHOLDS["underperforming"], THRESHOLDS["healthy"], THRESHOLDS["top_performer"]]
+_LABELS = ["failing", "underperforming", "healthy", "top_performer"]
 
-def load_yaml(path: Path) -> dict:
-    """Load YAML file."""
-    if not path.exists():
-        return {}
-    with open(path, 'r') as f:
-        return yaml.safe_load(f) or {}
-
-
-def save_yaml(path: Path, data: dict):
-    """Save YAML file."""
-    path.parent.mkdir(parents=True, exist_ok=True)
-    with open(path, 'w') as f:
-        yaml.dump(data, f, default_flow_style=False, sort_keys=False)
-
+# Trailing window of fitness_history entries kept in the skill YAML;
+# older entries are archived to a sidecar log under changelogs/
+FITNESS_HISTORY_LIMIT = 50
 
 def run_evaluate() -> dict:
     """Run evaluate.sh and return results."""
+    # Keep the output as bytes; the JSON parser takes them directly, so
+    # there is no extra UTF-8 decode pass over the whole payload
     result = subprocess.run(
         [str(DARWIN_DIR / "bin" / "evaluate.sh")],
-        capture_output=True, text=True
+        stdout=subprocess.PIPE, stderr=subprocess.PIPE
     )
     if result.returncode != 0:
-        return {"error": result.stderr, "skills": []}
+        return {"error": result.stderr.decode('utf-8', 'replace'), "skills": []}
+    if orjson is not None:
+        return orjson.loads(result.stdout)
     return json.loads(result.stdout)
 
 
-def get_module_variants(registry: dict, module_type: str) -> List[str]:
-    """Get all variants for a module type."""
-    modules = registry.get('modules', {})
-    module = modules.get(module_type, {})
-    return list(module.keys())
+def get_variants_by_type(registry: dict) -> Dict[str, List[str]]:
+    """Map each module type to its available variants."""
+    return {
+        module_type: list(module.keys())
+        for module_type, module in registry.get('modules', {}).items()
+    }
 
 
 def classify_skill(fitness: float) -> str:
     """Classify skill by fitness score."""
-    if fitness >= THRESHOLDS["top_performer"]:
-        return "top_performer"
-    elif fitness >= THRESHOLDS["healthy"]:
-        return "healthy"
-    elif fitness >= THRESHOLDS["underperforming"]:
-        return "underperforming"
-    else:
-        return "failing"
+    return _LABELS[bisect.bisect_right(_CUTS, fitness)]
+
+
+def index_evaluation(evaluation: dict) -> Dict[str, Optional[float]]:
+    """Index evaluation results as a {skill_name: fitness} dict."""
+    return {s['skill']: s.get('fitness') for s in evaluation.get('skills', [])}
 
 
-def get_skill_fitness(evaluation: dict, skill_name: str) -> Optional[float]:
-    """Get fitness score for a specific skill from evaluation results."""
-    for skill in evaluation.get('skills', []):
-        if skill.get('skill') == skill_name:
-            return skill.get('fitness')
-    return None
+# Matches the legacy "module: old → new" mutation string format
+_MUT_RE = re.compile(r'(\w+):\s*\S+\s*→\s*(\S+)')
 
 
 def get_recently_tried_variants(skill_def: dict) -> set:
@@ -100,23 +103,31 @@ def get_recently_tried_variants(skill_def: dict) -> set:
     recent_history = skill_def.get('fitness_history', [])[-10:]
     recently_tried = set()
     for h in recent_history:
-        mutation_str = h.get('mutation', '')
-        if '→' in mutation_str:
-            # Extract "module: old → new" format
-            parts = mutation_str.split('→')
-            if len(parts) == 2:
-                # Get the "to" version (after arrow)
-                to_version = parts[1].strip()
-                # Get module name from "module: old" part
-                module_parts = parts[0].split(':')
-                if len(module_parts) == 2:
-                    module_name = module_parts[0].strip()
-                    recently_tried.add(f"{module_name}:{to_version}")
+        # Newer entries carry structured fields; older ones only the string
+        module_name = h.get('module')
+        to_version = h.get('to_version')
+        if module_name and to_version:
+            recently_tried.add(f"{module_name}:{to_version}")
+            continue
+        m = _MUT_RE.search(h.get('mutation', ''))
+        if m:
+            recently_tried.add(f"{m.group(1)}:{m.group(2)}")
     return recently_tried
 
 
+def load_top_performer_defs(top_performers: List[dict]) -> List[Tuple[dict, dict]]:
+    """Load each top performer's skill definition once for reuse across skills."""
+    loaded = []
+    for top in top_performers:
+        top_skill_file = SKILLS_DIR / f"{top['skill']}.yaml"
+        if top_skill_file.exists():
+            loaded.append((top, load_yaml(top_skill_file)))
+    return loaded
+
+
 def suggest_mutations(skill_name: str, skill_def: dict, fitness: float,
-                      registry: dict, top_performers: List[dict]) -> List[dict]:
+                      variants_by_type: Dict[str, List[str]],
+                      top_performers: List[Tuple[dict, dict]]) -> List[dict]:
     """Suggest module mutations for a skill."""
     suggestions = []
     current_modules = skill_def.get('modules', {})
@@ -128,31 +139,33 @@ def suggest_mutations(skill_name: str, skill_def: dict, fitness: float,
     if classification in ["healthy", "top_performer"]:
         return []  # Don't mutate successful skills
 
+    # Tracks (module, to_version) pairs already suggested, so the mutate
+    # loop below is a set lookup instead of a scan over suggestions
+    suggested_keys = set()
+
     # Strategy 1: Copy modules from top performers
-    for top in top_performers:
-        top_skill_file = SKILLS_DIR / f"{top['skill']}.yaml"
-        if top_skill_file.exists():
-            top_def = load_yaml(top_skill_file)
-            top_modules = top_def.get('modules', {})
+    for top, top_def in top_performers:
+        top_modules = top_def.get('modules', {})
 
-            for module_type, top_version in top_modules.items():
-                variant_key = f"{module_type}:{top_version}"
-                # Skip if this variant was recently tried (prevents oscillation)
-                if variant_key in recently_tried:
-                    continue
-                if current_modules.get(module_type) != top_version:
-                    suggestions.append({
-                        "type": "absorb",
-                        "skill": skill_name,
-                        "module": module_type,
-                        "from_version": current_modules.get(module_type, "unknown"),
-                        "to_version": top_version,
-                        "reason": f"Absorb from top performer /{top['skill']} (fitness: {top['fitness']:.2f})"
-                    })
+        for module_type, top_version in top_modules.items():
+            variant_key = f"{module_type}:{top_version}"
+            # Skip if this variant was recently tried (prevents oscillation)
+            if variant_key in recently_tried:
+                continue
+            if current_modules.get(module_type) != top_version:
+                suggested_keys.add((module_type, top_version))
+                suggestions.append({
+                    "type": "absorb",
+                    "skill": skill_name,
+                    "module": module_type,
+                    "from_version": current_modules.get(module_type, "unknown"),
+                    "to_version": top_version,
+                    "reason": f"Absorb from top performer /{top['skill']} (fitness: {top['fitness']:.2f})"
+                })
 
     # Strategy 2: Try alternative module versions
     for module_type, current_version in current_modules.items():
-        variants = get_module_variants(registry, module_type)
+        variants = variants_by_type.get(module_type, [])
         for variant in variants:
             variant_key = f"{module_type}:{variant}"
             # Skip if recently tried (prevents oscillation)
@@ -160,19 +173,17 @@ def suggest_mutations(skill_name: str, skill_def: dict, fitness: float,
                 continue
             if variant != current_version:
                 # Only suggest if not already suggested via absorption
-                already_suggested = any(
-                    s['module'] == module_type and s['to_version'] == variant
-                    for s in suggestions
-                )
-                if not already_suggested:
-                    suggestions.append({
-                        "type": "mutate",
-                        "skill": skill_name,
-                        "module": module_type,
-                        "from_version": current_version,
-                        "to_version": variant,
-                        "reason": f"Try alternative variant (not recently tried)"
-                    })
+                if (module_type, variant) in suggested_keys:
+                    continue
+                suggested_keys.add((module_type, variant))
+                suggestions.append({
+                    "type": "mutate",
+                    "skill": skill_name,
+                    "module": module_type,
+                    "from_version": current_version,
+                    "to_version": variant,
+                    "reason": f"Try alternative variant (not recently tried)"
+                })
 
     # If all variants were recently tried, suggest waiting
     if not suggestions and classification in ["underperforming", "failing"]:
@@ -182,7 +193,8 @@ def suggest_mutations(skill_name: str, skill_def: dict, fitness: float,
     return suggestions
 
 
-def apply_mutation(skill_name: str, module_type: str, new_version: str) -> bool:
+def apply_mutation(skill_name: str, module_type: str, new_version: str,
+                   timestamp: Optional[str] = None) -> bool:
     """Apply a single mutation to a skill."""
     skill_file = SKILLS_DIR / f"{skill_name}.yaml"
     if not skill_file.exists():
@@ -207,42 +219,43 @@ def apply_mutation(skill_name: str, module_type: str, new_version: str) -> bool:
     if 'fitness_history' not in skill_def:
         skill_def['fitness_history'] = []
     skill_def['fitness_history'].append({
-        "timestamp": datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ"),
-        "mutation": f"{module_type}: {old_version} → {new_version}"
+        "timestamp": timestamp or datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ"),
+        "mutation": f"{module_type}: {old_version} → {new_version}",
+        "module": module_type,
+        "to_version": new_version
     })
 
+    # Keep the on-disk history bounded so load/save stays O(window);
+    # the dropped tail goes to an append-only archive
+    history = skill_def['fitness_history']
+    if len(history) > FITNESS_HISTORY_LIMIT:
+        append_yaml(CHANGELOGS_DIR / f"{skill_name}.history.yaml",
+                    history[:-FITNESS_HISTORY_LIMIT])
+        skill_def['fitness_history'] = history[-FITNESS_HISTORY_LIMIT:]
+
     save_yaml(skill_file, skill_def)
     return True
 
 
-def recompile_skill(skill_name: str) -> bool:
-    """Recompile a skill after mutation."""
-    result = subprocess.run(
-        ["python3", str(DARWIN_DIR / "bin" / "compile.py"), skill_name],
-        capture_output=True, text=True
-    )
-    return result.returncode == 0
+def recompile_skill(skill_name: str, prompts: dict) -> bool:
+    """Recompile a skill after mutation, reusing the flattened module prompts."""
+    return compile_mod.compile_skill(skill_name, prompts)
 
 
-def write_changelog(skill_name: str, mutations: List[dict], old_fitness: float, new_fitness: Optional[float] = None):
-    """Write changelog entry for skill evolution."""
+def write_changelog(skill_name: str, mutations: List[dict], old_fitness: float,
+                    new_fitness: Optional[float] = None, timestamp: Optional[str] = None):
+    """Append a changelog entry for skill evolution (oldest entry first)."""
     changelog_file = CHANGELOGS_DIR / f"{skill_name}.md"
     CHANGELOGS_DIR.mkdir(parents=True, exist_ok=True)
 
-    # Load existing changelog
-    if changelog_file.exists():
-        with open(changelog_file, 'r') as f:
-            content = f.read()
-    else:
-        content = f"# /{skill_name} Evolution Changelog\n\n"
-
     # Get current version
     skill_file = SKILLS_DIR / f"{skill_name}.yaml"
     skill_def = load_yaml(skill_file) if skill_file.exists() else {}
     version = skill_def.get('version', '?.?.?')
 
     # Build entry
-    timestamp = datetime.utcnow().strftime("%Y-%m-%d %H:%M UTC")
+    if timestamp is None:
+        timestamp = datetime.utcnow().strftime("%Y-%m-%d %H:%M UTC")
     entry = f"\n## v{version} ({timestamp})\n\n"
     entry += f"**Fitness:** {old_fitness:.2f}"
     if new_fitness is not None:
@@ -257,35 +270,40 @@ def write_changelog(skill_name: str, mutations: List[dict], old_fitness: float,
 
     entry += "\n---\n"
 
-    # Prepend entry (newest first)
-    header_end = content.find("\n## ")
-    if header_end == -1:
-        content = content + entry
-    else:
-        content = content[:header_end] + entry + content[header_end:]
+    # Append-only: write the header once, then add entries at EOF, so a
+    # mutation costs O(entry) instead of rewriting the whole file
+    if not changelog_file.exists():
+        changelog_file.write_text(f"# /{skill_name} Evolution Changelog\n\n")
+
+    with open(changelog_file, 'a') as f:
+        f.write(entry)
+
 
-    with open(changelog_file, 'w') as f:
-        f.write(content)
+# All eleven possible 10-char fitness bars, indexed by filled count
+_BARS = ["█" * i + "░" * (10 - i) for i in range(11)]
 
 
 def print_status(evaluation: dict):
     """Print current fitness status."""
-    print("═══════════════════════════════════════════════════")
-    print("DARWIN EVOLUTION STATUS")
-    print("═══════════════════════════════════════════════════")
-    print()
+    # Accumulate lines and emit in one write instead of a print per row
+    out = []
+    out.append("═══════════════════════════════════════════════════")
+    out.append("DARWIN EVOLUTION STATUS")
+    out.append("═══════════════════════════════════════════════════")
+    out.append("")
 
     total = evaluation.get('total_invocations', 0)
-    print(f"DATA: {total} skill invocations │ Period: last 7 days")
-    print()
+    out.append(f"DATA: {total} skill invocations │ Period: last 7 days")
+    out.append("")
 
     skills = evaluation.get('skills', [])
     if not skills:
-        print("No skills to evaluate.")
+        out.append("No skills to evaluate.")
+        sys.stdout.write("\n".join(out) + "\n")
         return
 
-    print("SKILL FITNESS")
-    print("───────────────────────────────────────────────────")
+    out.append("SKILL FITNESS")
+    out.append("───────────────────────────────────────────────────")
 
     for i, skill in enumerate(skills, 1):
         name = skill['skill']
@@ -293,9 +311,8 @@ def print_status(evaluation: dict):
         invocations = skill['invocations']
         classification = classify_skill(fitness)
 
-        # Build bar
-        bar_filled = int(fitness * 10)
-        bar = "█" * bar_filled + "░" * (10 - bar_filled)
+        # Look up the precomputed bar
+        bar = _BARS[min(int(fitness * 10), 10)]
 
         # Status indicator
         if classification == "top_performer":
@@ -307,11 +324,12 @@ def print_status(evaluation: dict):
         else:
             status = "✗"
 
-        print(f" {i:2}. /{name:12} {bar}  {fitness:.2f}  [{invocations:2} uses] {status}")
+        out.append(f" {i:2}. /{name:12} {bar}  {fitness:.2f}  [{invocations:2} uses] {status}")
 
-    print()
-    print("LEGEND: ★ top performer  ✓ healthy  ↓ underperforming  ✗ failing")
-    print("═══════════════════════════════════════════════════")
+    out.append("")
+    out.append("LEGEND: ★ top performer  ✓ healthy  ↓ underperforming  ✗ failing")
+    out.append("═══════════════════════════════════════════════════")
+    sys.stdout.write("\n".join(out) + "\n")
 
 
 def cmd_status():
@@ -331,15 +349,20 @@ def cmd_suggest():
         return
 
     registry = load_yaml(MODULES_FILE)
+    variants_by_type = get_variants_by_type(registry)
     skills = evaluation.get('skills', [])
 
-    # Identify top performers
-    top_performers = [s for s in skills if classify_skill(s['fitness']) == "top_performer"]
+    # Identify top performers and load their definitions once
+    top_performers = load_top_performer_defs(
+        [s for s in skills if classify_skill(s['fitness']) == "top_performer"]
+    )
 
-    print("═══════════════════════════════════════════════════")
-    print("DARWIN EVOLUTION SUGGESTIONS")
-    print("═══════════════════════════════════════════════════")
-    print()
+    # Accumulate lines and emit in one write instead of a print per line
+    out = []
+    out.append("═══════════════════════════════════════════════════")
+    out.append("DARWIN EVOLUTION SUGGESTIONS")
+    out.append("═══════════════════════════════════════════════════")
+    out.append("")
 
     all_suggestions = []
 
@@ -355,29 +378,30 @@ def cmd_suggest():
 
             skill_def = load_yaml(skill_file)
             suggestions = suggest_mutations(
-                skill_name, skill_def, fitness, registry, top_performers
+                skill_name, skill_def, fitness, variants_by_type, top_performers
             )
 
             if suggestions:
-                print(f"/{skill_name} (fitness: {fitness:.2f}, {classification})")
-                print("───────────────────────────────────────────────────")
+                out.append(f"/{skill_name} (fitness: {fitness:.2f}, {classification})")
+                out.append("───────────────────────────────────────────────────")
 
                 # Show top 3 suggestions
                 for s in suggestions[:3]:
-                    print(f"  [{s['type'].upper()}] {s['module']}: {s['from_version']} → {s['to_version']}")
-                    print(f"           {s['reason']}")
+                    out.append(f"  [{s['type'].upper()}] {s['module']}: {s['from_version']} → {s['to_version']}")
+                    out.append(f"           {s['reason']}")
 
                 all_suggestions.extend(suggestions[:3])
-                print()
+                out.append("")
 
     if not all_suggestions:
-        print("No mutations needed. All skills are healthy or top performers.")
+        out.append("No mutations needed. All skills are healthy or top performers.")
     else:
-        print(f"Total suggestions: {len(all_suggestions)}")
-        print()
-        print("Run 'python evolve.py apply' to apply top suggestion per skill.")
+        out.append(f"Total suggestions: {len(all_suggestions)}")
+        out.append("")
+        out.append("Run 'python evolve.py apply' to apply top suggestion per skill.")
 
-    print("═══════════════════════════════════════════════════")
+    out.append("═══════════════════════════════════════════════════")
+    sys.stdout.write("\n".join(out) + "\n")
 
 
 def cmd_apply():
@@ -388,14 +412,23 @@ def cmd_apply():
         return
 
     registry = load_yaml(MODULES_FILE)
+    variants_by_type = get_variants_by_type(registry)
+    prompts = compile_mod.flatten_registry(registry)
     skills = evaluation.get('skills', [])
-    top_performers = [s for s in skills if classify_skill(s['fitness']) == "top_performer"]
+    top_performers = load_top_performer_defs(
+        [s for s in skills if classify_skill(s['fitness']) == "top_performer"]
+    )
 
     print("═══════════════════════════════════════════════════")
     print("DARWIN EVOLUTION - APPLYING MUTATIONS")
     print("═══════════════════════════════════════════════════")
     print()
 
+    # All mutations in one apply share a single evolution moment
+    now = datetime.utcnow()
+    now_iso = now.strftime("%Y-%m-%dT%H:%M:%SZ")
+    now_log = now.strftime("%Y-%m-%d %H:%M UTC")
+
     mutations_applied = []
 
     for skill_data in skills:
@@ -412,7 +445,7 @@ def cmd_apply():
 
         skill_def = load_yaml(skill_file)
         suggestions = suggest_mutations(
-            skill_name, skill_def, fitness, registry, top_performers
+            skill_name, skill_def, fitness, variants_by_type, top_performers
         )
 
         if not suggestions:
@@ -427,38 +460,16 @@ def cmd_apply():
         print(f"  Reason: {suggestion['reason']}")
 
         # Apply mutation
-        if apply_mutation(skill_name, suggestion['module'], suggestion['to_version']):
+        if apply_mutation(skill_name, suggestion['module'], suggestion['to_version'],
+                          timestamp=now_iso):
             # Recompile skill
-            if recompile_skill(skill_name):
+            if recompile_skill(skill_name, prompts):
                 print(f"  ✓ Mutation applied and recompiled")
-
-                # Post-mutation fitness verification
-                print(f"  ⏳ Verifying fitness change...")
-                new_evaluation = run_evaluate()
-                new_fitness = get_skill_fitness(new_evaluation, skill_name)
-
-                if new_fitness is not None:
-                    delta = new_fitness - fitness
-                    if delta > 0:
-                        print(f"  ✓ Fitness improved: {fitness:.2f} → {new_fitness:.2f} (+{delta:.2f})")
-                    elif delta < 0:
-                        print(f"  ⚠ Fitness dropped: {fitness:.2f} → {new_fitness:.2f} ({delta:.2f})")
-                        print(f"    Consider: python evolve.py rollback {skill_name}")
-                    else:
-                        print(f"  → Fitness unchanged: {fitness:.2f}")
-                else:
-                    new_fitness = fitness  # Use old if can't evaluate
-                    print(f"  ⚠ Could not verify fitness (using baseline)")
-
                 mutations_applied.append({
                     "skill": skill_name,
                     "old_fitness": fitness,
-                    "new_fitness": new_fitness,
                     **suggestion
                 })
-
-                # Write changelog with new fitness
-                write_changelog(skill_name, [suggestion], fitness, new_fitness)
             else:
                 print(f"  ✗ Recompilation failed")
         else:
@@ -467,6 +478,35 @@ def cmd_apply():
         print()
 
     if mutations_applied:
+        # Post-mutation fitness verification: one evaluation pass for the
+        # whole batch instead of one per applied mutation
+        print("⏳ Verifying fitness changes...")
+        fitness_index = index_evaluation(run_evaluate())
+
+        for applied in mutations_applied:
+            name = applied['skill']
+            old_fitness = applied['old_fitness']
+            new_fitness = fitness_index.get(name)
+
+            if new_fitness is not None:
+                delta = new_fitness - old_fitness
+                if delta > 0:
+                    print(f"  ✓ /{name}: fitness improved: {old_fitness:.2f} → {new_fitness:.2f} (+{delta:.2f})")
+                elif delta < 0:
+                    print(f"  ⚠ /{name}: fitness dropped: {old_fitness:.2f} → {new_fitness:.2f} ({delta:.2f})")
+                    print(f"    Consider: python evolve.py rollback {name}")
+                else:
+                    print(f"  → /{name}: fitness unchanged: {old_fitness:.2f}")
+            else:
+                new_fitness = old_fitness  # Use old if can't evaluate
+                print(f"  ⚠ /{name}: could not verify fitness (using baseline)")
+
+            applied['new_fitness'] = new_fitness
+
+            # Write changelog with new fitness
+            write_changelog(name, [applied], old_fitness, new_fitness, timestamp=now_log)
+
+        print()
         print("───────────────────────────────────────────────────")
         print(f"Applied {len(mutations_applied)} mutation(s)")
         print("Changelogs updated in ~/.claude/darwin/changelogs/")
@@ -494,34 +534,38 @@ def cmd_cycle():
     skills = evaluation.get('skills', [])
     print(f"Evaluated {len(skills)} skills")
 
-    top = [s for s in skills if classify_skill(s['fitness']) == "top_performer"]
-    healthy = [s for s in skills if classify_skill(s['fitness']) == "healthy"]
-    under = [s for s in skills if classify_skill(s['fitness']) == "underperforming"]
-    failing = [s for s in skills if classify_skill(s['fitness']) == "failing"]
+    # Bucket skills in a single pass, one classify call each
+    buckets = {label: [] for label in _LABELS}
+    for s in skills:
+        buckets[classify_skill(s['fitness'])].append(s)
 
-    print(f"  Top performers: {len(top)}")
-    print(f"  Healthy: {len(healthy)}")
-    print(f"  Underperforming: {len(under)}")
-    print(f"  Failing: {len(failing)}")
+    print(f"  Top performers: {len(buckets['top_performer'])}")
+    print(f"  Healthy: {len(buckets['healthy'])}")
+    print(f"  Underperforming: {len(buckets['underperforming'])}")
+    print(f"  Failing: {len(buckets['failing'])}")
     print()
 
     # Step 2: Save snapshot
     print("Step 2: SNAPSHOT")
     print("───────────────────────────────────────────────────")
-    week = datetime.utcnow().strftime("%Y-W%V")
+    now = datetime.utcnow()
+    week = now.strftime("%Y-W%V")
     snapshot_file = EVALUATIONS_DIR / f"{week}.json"
     EVALUATIONS_DIR.mkdir(parents=True, exist_ok=True)
 
-    evaluation['snapshot_time'] = datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ")
-    with open(snapshot_file, 'w') as f:
-        json.dump(evaluation, f, indent=2)
+    evaluation['snapshot_time'] = now.strftime("%Y-%m-%dT%H:%M:%SZ")
+    if orjson is not None:
+        snapshot_file.write_bytes(orjson.dumps(evaluation, option=orjson.OPT_INDENT_2))
+    else:
+        with open(snapshot_file, 'w') as f:
+            json.dump(evaluation, f, indent=2)
     print(f"Saved: {snapshot_file}")
     print()
 
     # Step 3: Evolve
     print("Step 3: EVOLVE")
     print("───────────────────────────────────────────────────")
-    if under or failing:
+    if buckets['underperforming'] or buckets['failing']:
         cmd_apply()
     else:
         print("All skills are healthy. No evolution needed.")